@@ -10,112 +10,645 @@ import json
 import sys
 import os
 import sqlite3
+import subprocess
+import hashlib
+import importlib.util
+import queue
+import threading
+from collections import Counter
+from functools import cached_property, lru_cache, partial
 from datetime import datetime
 from typing import Dict, List, Any
 
-# Add src directory to path for imports
+# Add src directory to path for imports (AIMProcessor is imported on first use)
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
-from aim_processor import AIMProcessor
+
+# orjson is required, not optional: data hashes are taken over its compact,
+# key-sorted bytes, and the stdlib encoder formats some floats differently
+# (1e+16 vs 1e16) and rejects values orjson accepts (datetime, non-str keys),
+# so falling back to it would change the duplicate-detection hash
+import orjson
+
+
+def _dumps_bytes(obj):
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    except orjson.JSONEncodeError as e:
+        # Chiefly integers past 64 bits, which orjson can't encode (json.dumps could)
+        raise ValueError(f"Record can't be stored: {e} (store such values as text)") from e
+
+
+def _dumps_pretty(obj):
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+
+def _loads(text):
+    # Rows saved by older builds went through json.dumps and may hold NaN/Infinity,
+    # which orjson refuses; the stdlib decoder still reads them
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text)
+
+
+def _compact_separators(text):
+    """Drop the spaces json.dumps puts after ':' and ',' between JSON tokens (see SQL_FIND_RECORDS)."""
+    return text.replace('": ', '":').replace(', "', ',"')
+
+
+def _reject_json_constant(name):
+    raise ValueError(f"{name} is not valid JSON and can't be stored")
+
+
+def _parse_json_input(text):
+    """
+    Parse JSON typed by the user, keeping every value exactly as entered.
+
+    The stdlib parser keeps big integers exact (orjson would turn them into
+    floats); NaN/Infinity and anything _dumps_bytes can't encode raise ValueError
+    instead of being stored as something else.
+    """
+    data = json.loads(text, parse_constant=_reject_json_constant)
+    _dumps_bytes(data)
+    return data
+
+
+def _read_excel(path, **kwargs):
+    """pd.read_excel through the Rust calamine engine when it is installed, else pandas' default."""
+    import pandas as pd
+    try:
+        return pd.read_excel(path, engine="calamine", **kwargs)
+    except (ImportError, ValueError):
+        # python-calamine missing, or a pandas release without the calamine engine
+        return pd.read_excel(path, **kwargs)
+
+
+def _write_workbook(target, sheets):
+    """
+    Write {sheet name: {column name: values}} to an .xlsx file, one sheet per entry.
+
+    Rows are streamed in order, through xlsxwriter's constant_memory mode when
+    it is installed, else openpyxl's write-only workbook; strings starting
+    with '=' are stored as formulas.
+    """
+    try:
+        import xlsxwriter
+    except ImportError:
+        xlsxwriter = None
+    
+    if xlsxwriter is not None:
+        # URL-like strings stay plain text, as they are in openpyxl's output
+        workbook = xlsxwriter.Workbook(target, {'constant_memory': True, 'strings_to_urls': False})
+        header_format = workbook.add_format({'bold': True})
+        for sheet_name, columns in sheets.items():
+            sheet = workbook.add_worksheet(sheet_name)
+            sheet.write_row(0, 0, list(columns), header_format)
+            for row_number, row in enumerate(zip(*columns.values()), 1):
+                sheet.write_row(row_number, 0, row)
+        workbook.close()
+        return
+    
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    
+    workbook = Workbook(write_only=True)
+    header_font = Font(bold=True)
+    for sheet_name, columns in sheets.items():
+        sheet = workbook.create_sheet(sheet_name)
+        header = []
+        for column_name in columns:
+            cell = WriteOnlyCell(sheet, value=column_name)
+            cell.font = header_font
+            header.append(cell)
+        sheet.append(header)
+        for row in zip(*columns.values()):
+            sheet.append(row)
+    workbook.save(target)
+
+
+def _iter_sheet_rows(path, sheet_name=None):
+    """Yield a worksheet's rows (the first sheet by default) as value tuples via openpyxl's read-only reader."""
+    if path.lower().endswith('.xls'):
+        # Legacy .xls is not readable by openpyxl; blank cells come back as None either way
+        frame = _read_excel(path, sheet_name=sheet_name if sheet_name is not None else 0, header=None)
+        yield from frame.astype(object).where(frame.notna(), None).itertuples(index=False, name=None)
+        return
+    from openpyxl import load_workbook
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = workbook[sheet_name] if sheet_name is not None else workbook.worksheets[0]
+        yield from sheet.iter_rows(values_only=True)
+    finally:
+        # Read-only workbooks keep the file open until closed
+        workbook.close()
+
+
+def _read_header_row(path):
+    """Column names from the first row of a workbook's first sheet, without parsing the rest."""
+    if path.lower().endswith('.xls'):
+        # Legacy .xls is not readable by openpyxl
+        return list(_read_excel(path, nrows=0).columns)
+    rows = _iter_sheet_rows(path)
+    try:
+        header = next(rows, ())
+    finally:
+        rows.close()
+    return [col for col in header if col is not None]
+
+
+@lru_cache(maxsize=1)
+def _bulk_template_bytes():
+    """The bulk-entry template workbook (.xlsx), built once per session."""
+    import io
+    
+    # Sample template structure
+    template_data = {
+        'Product_Type': ['life', 'annuity', 'health'],
+        'Applicant_First_Name': ['John', 'Jane', 'Bob'],
+        'Applicant_Last_Name': ['Doe', 'Smith', 'Johnson'],
+        'Date_of_Birth': ['1980-01-15', '1975-03-22', '1990-08-10'],
+        'Gender': ['M', 'F', 'M'],
+        'Coverage_Amount': [250000, 150000, 300000],
+        'Premium_Amount': [150.50, 89.25, 200.75]
+    }
+    
+    # Instructions sheet
+    instructions = {
+        'Field': ['Product_Type', 'Applicant_First_Name', 'Applicant_Last_Name', 
+                 'Date_of_Birth', 'Gender', 'Coverage_Amount', 'Premium_Amount'],
+        'Description': [
+            'Insurance product type (life, annuity, health)',
+            'First name of the applicant',
+            'Last name of the applicant', 
+            'Birth date in YYYY-MM-DD format',
+            'Gender (M/F)',
+            'Coverage amount in dollars',
+            'Premium amount in dollars'
+        ],
+        'Required': ['Yes', 'Yes', 'Yes', 'Yes', 'Yes', 'Yes', 'Yes']
+    }
+    
+    buffer = io.BytesIO()
+    _write_workbook(buffer, {'Data_Entry': template_data, 'Instructions': instructions})
+    return buffer.getvalue()
+
+
+# Example records shown by "Show Sample" in the Add JSON Data dialog
+_SAMPLE_DATA = {
+    "life": {
+        "applicant_first_name": "John",
+        "applicant_last_name": "Doe",
+        "date_of_birth": "1980-01-15",
+        "gender": "M",
+        "marital_status": "Married",
+        "occupation": "Software Engineer",
+        "annual_income": 85000,
+        "coverage_amount": 250000,
+        "premium_amount": 150.50,
+        "policy_term": 20,
+        "beneficiary_name": "Jane Doe",
+        "beneficiary_relationship": "Spouse",
+        "health_questions": {
+            "smoker": False,
+            "chronic_conditions": "None",
+            "medications": "None"
+        },
+        "contact_info": {
+            "phone": "555-123-4567",
+            "email": "john.doe@email.com",
+            "address": {
+                "street": "123 Main St",
+                "city": "Anytown",
+                "state": "CA",
+                "zip": "12345"
+            }
+        }
+    },
+    "annuity": {
+        "applicant_first_name": "Mary",
+        "applicant_last_name": "Johnson",
+        "date_of_birth": "1965-08-22",
+        "gender": "F",
+        "retirement_age": 65,
+        "initial_deposit": 50000,
+        "monthly_contribution": 500,
+        "annuity_type": "Fixed",
+        "payout_option": "Life Only",
+        "investment_risk_tolerance": "Conservative",
+        "beneficiary_info": {
+            "primary_beneficiary": "Robert Johnson",
+            "relationship": "Spouse",
+            "percentage": 100
+        },
+        "contact_info": {
+            "phone": "555-987-6543",
+            "email": "mary.johnson@email.com"
+        }
+    },
+    "health": {
+        "applicant_first_name": "David",
+        "applicant_last_name": "Wilson",
+        "date_of_birth": "1985-12-03",
+        "gender": "M",
+        "family_size": 4,
+        "coverage_type": "Family",
+        "deductible": 2500,
+        "monthly_premium": 425.75,
+        "network_preference": "PPO",
+        "pre_existing_conditions": [],
+        "prescription_coverage": True,
+        "dental_coverage": True,
+        "vision_coverage": False,
+        "employer_contribution": 300,
+        "contact_info": {
+            "phone": "555-456-7890",
+            "email": "david.wilson@email.com"
+        }
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def _sample_json(product_type):
+    """Indented JSON text for a product's sample record, rendered once per product."""
+    return _dumps_pretty(_SAMPLE_DATA[product_type])
+
+
+def _name_key(data):
+    """Normalized "first last" applicant name used to spot duplicate people, or None."""
+    if not isinstance(data, dict):
+        return None
+    first_name = str(data.get('applicant_first_name', data.get('first_name', ''))).lower().strip()
+    last_name = str(data.get('applicant_last_name', data.get('last_name', ''))).lower().strip()
+    if first_name and last_name:
+        return f"{first_name} {last_name}"
+    return None
+
+
+# The results pane keeps at most this many lines; older output is dropped from the top
+RESULTS_MAX_LINES = 2000
+
+# Main operation buttons: (text, method name, method argument or None, row, column, color, hover color)
+_BUTTONS = (
+    ("📝 Add JSON Data", "enter_custom_data", None, 0, 0, "#3498db", "#2980b9"),
+    ("📦 Bulk JSON Load", "bulk_json_load", None, 0, 1, "#9b59b6", "#8e44ad"),
+    ("📊 Life Field Mapping", "show_field_mapping_with_loading", "life", 0, 2, "#e67e22", "#d35400"),
+    ("📋 View Stored Data", "show_stored_data", None, 1, 0, "#1abc9c", "#16a085"),
+    ("🔍 Check Duplicates", "show_duplicate_check", None, 1, 1, "#f39c12", "#e67e22"),
+    ("📊 Annuity Field Mapping", "show_field_mapping_with_loading", "annuity", 1, 2, "#8e44ad", "#7d3c98"),
+    ("❓ Help", "show_help", None, 2, 0, "#34495e", "#2c3e50"),
+    ("🗑️ Clear Database", "clear_database", None, 2, 1, "#e74c3c", "#c0392b"),
+)
+
+# Simple FAST UI -> calculator field suggestions, checked in order by suggest_actuarial_field
+_FIELD_SUGGESTIONS = (
+    ('first_name', 'Insured_First_Name'),
+    ('last_name', 'Insured_Last_Name'),
+    ('date_of_birth', 'Birth_Date'),
+    ('coverage_amount', 'Coverage_Amount'),
+    ('premium_amount', 'Premium_Amount'),
+    ('gender', 'Gender'),
+    ('policy_number', 'Policy_Number'),
+)
+
+# Bind tag shared by buttons built with create_button, so one class binding handles hover
+HOVER_BUTTON_TAG = "HoverButton"
+
+# Bumped whenever stored rows need a one-shot migration (see init_database)
+DB_SCHEMA_VERSION = 2
+
+# SQL is kept in module constants so every call passes the identical string
+# and hits the connection's prepared statement cache
+SQL_CREATE_TABLE = '''
+    CREATE TABLE IF NOT EXISTS user_data (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        data_hash TEXT UNIQUE,
+        product_type TEXT NOT NULL,
+        json_data TEXT NOT NULL,
+        timestamp TEXT NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        name_key TEXT
+    )
+'''
+SQL_CREATE_PRODUCT_INDEX = 'CREATE INDEX IF NOT EXISTS idx_user_data_product ON user_data(product_type)'
+SQL_CREATE_NAME_INDEX = 'CREATE INDEX IF NOT EXISTS idx_user_data_name ON user_data(name_key)'
+# Index entries end with the rowid, so this serves every ORDER BY created_at, id without a sort
+SQL_CREATE_CREATED_INDEX = 'CREATE INDEX IF NOT EXISTS idx_user_data_created ON user_data(created_at)'
+SQL_INSERT = ('INSERT OR IGNORE INTO user_data (data_hash, product_type, json_data, timestamp, name_key) '
+              'VALUES (?, ?, ?, ?, ?)')
+# Single-row saves let SQLite format the local timestamp (same "%Y-%m-%d %H:%M:%S" layout)
+SQL_INSERT_NOW = ('INSERT OR IGNORE INTO user_data (data_hash, product_type, json_data, timestamp, name_key) '
+                  "VALUES (?, ?, ?, datetime('now', 'localtime'), ?)")
+SQL_LOAD_ALL = 'SELECT product_type, json_data, timestamp FROM user_data ORDER BY created_at, id'
+# Record list for the stored-data view: position in save order, row id, metadata and the
+# field count, filtered by a case-insensitive search term ('' lists everything). The JSON
+# text is searched and counted inside SQLite, so nothing is decoded in Python. Rows from
+# older builds use json.dumps' '": ' / ', "' separators, so both the text and the term are
+# searched in the compact form new rows are stored in.
+SQL_FIND_RECORDS = '''
+    SELECT position, id, product_type, timestamp,
+           CASE WHEN json_valid(json_data) THEN (SELECT COUNT(*) FROM json_each(json_data))
+                ELSE py_field_count(json_data) END
+    FROM (SELECT row_number() OVER (ORDER BY created_at, id) AS position,
+                 id, product_type, timestamp, json_data
+          FROM user_data)
+    WHERE ? = '' OR instr(py_lower(product_type || ' ' || timestamp || ' ' ||
+                                   replace(replace(json_data, '": ', '":'), ', "', ',"')), ?) > 0
+    ORDER BY position
+'''
+SQL_RECORD_DATA = 'SELECT json_data FROM user_data WHERE id = ?'
+SQL_COUNT_BY_PRODUCT = 'SELECT product_type, COUNT(*) FROM user_data GROUP BY product_type'
+SQL_CLEAR = 'DELETE FROM user_data'
+SQL_EXPORT = 'SELECT product_type, timestamp, json_data, json_valid(json_data) FROM user_data ORDER BY created_at, id'
+# Every record whose applicant name appears more than once, grouped via idx_user_data_name
+SQL_DUPLICATE_NAMES = '''
+    SELECT name_key, product_type, json_data, timestamp FROM user_data
+    WHERE name_key IN (SELECT name_key FROM user_data WHERE name_key IS NOT NULL
+                       GROUP BY name_key HAVING COUNT(*) > 1)
+    ORDER BY created_at, id
+'''
 
 class AIMDemoGUI:
     """GUI-based interactive demo for AIM processor."""
     def __init__(self):
-        self.processor = AIMProcessor()
-        self.user_data_store = []
+        self._log_buf = []
+        self._log_flush_pending = False
+        self._stats_refresh_pending = False
+        self._custom_dialog = None
+        self._custom_dialog_reset = None
+        # (normal, hover) background colors of each create_button button
+        self._hover_colors = {}
         self.root = tk.Tk()
         self.root.title("AIM - Actuarial Input Mapper Demo")
         self.root.geometry("850x650")
         self.db_path = "aim_data.db"
         self.init_database()
-        self.load_data_from_db()
+        # Bulk writes run on this thread so long inserts don't freeze the window. It
+        # writes through its own connection, so SQLite's locking keeps its batch
+        # transactions apart from saves and clears made on the Tk thread
+        self._writer_conn = self._connect()
+        self._writeq = queue.Queue()
+        self._pending_writes = 0
+        # Worker threads never call Tk; they post (callback, result) here for the Tk thread to run
+        self._resultq = queue.Queue()
+        self.root.after(50, self._poll_results)
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
         self.setup_ui()
 
+    def _connect(self):
+        """Open a connection to the database with the app's pragmas and SQL functions."""
+        # Autocommit, so batches BEGIN explicitly; WAL lets the Tk thread read while
+        # the writer thread's connection holds a write transaction
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                               cached_statements=256)
+        conn.executescript(
+            "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; "
+            "PRAGMA temp_store=MEMORY; PRAGMA cache_size=-20000; "
+            "PRAGMA mmap_size=134217728;"
+        )
+        # Python's Unicode-aware lower() for the stored-data search (SQLite's only folds ASCII)
+        conn.create_function("py_lower", 1, str.lower, deterministic=True)
+        # json_each rejects legacy rows holding NaN; those are counted after a Python decode
+        conn.create_function("py_field_count", 1, lambda text: len(_loads(text)), deterministic=True)
+        return conn
+
     def init_database(self):
-        """Initialize the SQLite database."""
+        """Open the Tk thread's SQLite connection and initialize the schema."""
+        # Per-product row counts, read from SQL on first use and then kept in step with
+        # writes; only ever touched on the Tk thread
+        self._product_counts = None
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS user_data (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    data_hash TEXT UNIQUE,
-                    product_type TEXT NOT NULL,
-                    json_data TEXT NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            conn.commit()
-            conn.close()
+            # One connection for the life of the app (closed in _on_close)
+            self._conn = self._connect()
+            cursor = self._conn.cursor()
+            cursor.execute(SQL_CREATE_TABLE)
+            cursor.execute(SQL_CREATE_PRODUCT_INDEX)
+            cursor.execute(SQL_CREATE_CREATED_INDEX)
+            cursor.execute('PRAGMA user_version')
+            version = cursor.fetchone()[0]
+            if version < DB_SCHEMA_VERSION:
+                rows = []
+                for row_id, json_data in cursor.execute('SELECT id, json_data FROM user_data'):
+                    try:
+                        rows.append((row_id, _loads(json_data)))
+                    except ValueError:
+                        continue  # Undecodable rows keep their old hash and get no name key
+                columns = {column[1] for column in cursor.execute('PRAGMA table_info(user_data)')}
+                with self._conn:
+                    cursor.execute('BEGIN')
+                    if version < 1:
+                        # Hashes written before version 1 came from the per-process salted hash()
+                        rehashed = []
+                        for row_id, data in rows:
+                            try:
+                                rehashed.append((self.get_data_hash(data), row_id))
+                            except ValueError:
+                                continue  # orjson can't encode it (e.g. an int past 64 bits)
+                        cursor.executemany('UPDATE OR IGNORE user_data SET data_hash = ? WHERE id = ?',
+                                           rehashed)
+                    if version < 2:
+                        # Version 2 stores the applicant name key used by check_for_duplicate_names
+                        if 'name_key' not in columns:
+                            cursor.execute('ALTER TABLE user_data ADD COLUMN name_key TEXT')
+                        cursor.executemany('UPDATE user_data SET name_key = ? WHERE id = ?',
+                                           [(_name_key(data), row_id) for row_id, data in rows])
+                    cursor.execute(f'PRAGMA user_version = {DB_SCHEMA_VERSION}')
+            cursor.execute(SQL_CREATE_NAME_INDEX)
         except Exception as e:
             messagebox.showerror("Database Error", f"Failed to initialize database: {e}")
 
     def get_data_hash(self, data_dict):
-        """Generate a hash for the data to check for duplicates."""
-        return str(hash(json.dumps(data_dict, sort_keys=True)))
+        """Generate a stable hash for the data to check for duplicates."""
+        return hashlib.blake2b(_dumps_bytes(data_dict), digest_size=16).hexdigest()
+
+    def _encode_record(self, data):
+        """Serialize data once and return (data_hash, json_data) for an insert."""
+        # The stored JSON is the same compact, key-sorted text the hash is taken over
+        payload = _dumps_bytes(data)
+        return hashlib.blake2b(payload, digest_size=16).hexdigest(), payload.decode("utf-8")
 
     def save_data_to_db(self, data, product_type):
         """Save data to database, checking for duplicates."""
         try:
-            data_hash = self.get_data_hash(data)
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('SELECT id FROM user_data WHERE data_hash = ?', (data_hash,))
-            existing = cursor.fetchone()
-            if existing:
-                conn.close()
+            data_hash, json_data = self._encode_record(data)
+        except ValueError as e:
+            return False, str(e)
+        try:
+            cursor = self._conn.cursor()
+            # The UNIQUE constraint on data_hash does the duplicate check
+            cursor.execute(SQL_INSERT_NOW, (data_hash, product_type, json_data, _name_key(data)))
+            if cursor.rowcount != 1:
                 return False, "This data already exists in the database."
-            cursor.execute('''
-                INSERT INTO user_data (data_hash, product_type, json_data, timestamp)
-                VALUES (?, ?, ?, ?)
-            ''', (data_hash, product_type, json.dumps(data), timestamp))
-            conn.commit()
-            conn.close()
+            if self._product_counts is not None:
+                self._product_counts[product_type] += 1
             return True, "Data saved successfully to database."
         except Exception as e:
             return False, f"Database error: {e}"
 
-    def load_data_from_db(self):
-        """Load all data from database into memory."""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('SELECT product_type, json_data, timestamp FROM user_data ORDER BY created_at')
-            rows = cursor.fetchall()
-            self.user_data_store = []
-            for row in rows:
-                self.user_data_store.append({
-                    'product_type': row[0],
-                    'data': json.loads(row[1]),
-                    'timestamp': row[2]
-                })
-            conn.close()
-        except Exception as e:
-            messagebox.showerror("Database Error", f"Failed to load data: {e}")
+    def save_many_to_db(self, records, batch_size=1000):
+        """
+        Save (data, product_type) pairs in batched transactions, skipping duplicates.
+
+        Returns (saved_count, duplicate_count, errors) where errors lists
+        (position, exception) for records that could not be encoded.
+        """
+        saved_count, duplicate_count, errors, failure = self._insert_many(self._conn, records, batch_size)
+        if saved_count:
+            # executemany does not say which rows landed, so recount on the next read
+            self._product_counts = None
+        if failure is not None:
+            raise failure
+        return saved_count, duplicate_count, errors
+
+    def _insert_many(self, conn, records, batch_size=1000):
+        """
+        save_many_to_db() through conn, leaving the counts cache to the caller (safe off the Tk thread).
+
+        Returns (saved_count, duplicate_count, errors, failure). failure is the
+        exception that stopped the save, or None; batches committed before it
+        are included in the counts.
+        """
+        # One timestamp for the whole call rather than one strftime per row
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        saved_count = 0
+        duplicate_count = 0
+        errors = []
+        for start in range(0, len(records), batch_size):
+            rows = []
+            for position, (data, product_type) in enumerate(records[start:start + batch_size], start):
+                try:
+                    data_hash, json_data = self._encode_record(data)
+                    rows.append((data_hash, product_type, json_data, timestamp, _name_key(data)))
+                except Exception as e:
+                    errors.append((position, e))
+            # One transaction per batch instead of one commit per row
+            try:
+                with conn:
+                    conn.execute('BEGIN')
+                    cursor = conn.executemany(SQL_INSERT, rows)
+            except Exception as e:
+                return saved_count, duplicate_count, errors, e
+            saved_count += cursor.rowcount
+            duplicate_count += len(rows) - cursor.rowcount
+        return saved_count, duplicate_count, errors, None
+
+    def submit_write(self, func, args, callback):
+        """Queue func(*args) for the writer thread; callback(result) then runs on the Tk thread.
+
+        func must write through self._writer_conn and leave Tk-thread state (such as
+        the counts cache) to the callback.
+        """
+        self._pending_writes += 1
+        self._writeq.put((func, args, partial(self._finish_write, callback)))
+
+    def _finish_write(self, callback, result):
+        """Count a queued write as done, then hand its result to callback."""
+        self._pending_writes -= 1
+        callback(result)
+
+    def _post_result(self, callback, result):
+        """Queue callback(result) to run on the Tk thread; safe to call from any thread."""
+        self._resultq.put((callback, result))
+
+    def _poll_results(self):
+        """Run the callbacks worker threads have posted, then check again shortly."""
+        self._run_posted_callbacks()
+        self.root.after(50, self._poll_results)
+
+    def _run_posted_callbacks(self):
+        """Run every (callback, result) waiting in the result queue, on the Tk thread."""
+        while True:
+            try:
+                callback, result = self._resultq.get_nowait()
+            except queue.Empty:
+                return
+            callback(result)
+
+    def _writer_loop(self):
+        """Run queued database writes off the Tk main loop until a None job arrives."""
+        while True:
+            job = self._writeq.get()
+            if job is None:
+                return
+            func, args, callback = job
+            try:
+                result = func(*args)
+            except Exception as e:
+                result = e
+            self._resultq.put((callback, result))
+
+    def run_in_background(self, func, args, callback):
+        """Run func(*args) on a worker thread; callback(result) then runs on the Tk thread.
+
+        An exception raised by func is passed to callback as the result.
+        """
+        def work():
+            try:
+                result = func(*args)
+            except Exception as e:
+                result = e
+            self._resultq.put((callback, result))
+        
+        threading.Thread(target=work, daemon=True).start()
+
+    @cached_property
+    def processor(self):
+        """AIM processor, imported and built the first time a mapping needs it."""
+        from aim_processor import AIMProcessor
+        return AIMProcessor()
+
+    def fetch_all_records(self):
+        """Decode every stored record, in save order (only for full-data exports)."""
+        cursor = self._conn.cursor()
+        cursor.arraysize = 1000
+        cursor.execute(SQL_LOAD_ALL)
+        # Iterate the cursor directly so rows are decoded as they are fetched
+        return [
+            {'product_type': product_type, 'data': _loads(json_data), 'timestamp': timestamp}
+            for product_type, json_data, timestamp in cursor
+        ]
+
+    def find_records(self, search_term=""):
+        """Return (position, id, product_type, timestamp, field_count) rows matching search_term."""
+        search_term = _compact_separators(search_term.lower()) if search_term.strip() else ""
+        return self._conn.execute(SQL_FIND_RECORDS, (search_term, search_term)).fetchall()
+
+    def get_record_data(self, record_id):
+        """Decode the stored JSON for a single record."""
+        return _loads(self._conn.execute(SQL_RECORD_DATA, (record_id,)).fetchone()[0])
 
     def get_db_stats(self):
         """Get database statistics."""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('SELECT COUNT(*) FROM user_data')
-            total_count = cursor.fetchone()[0]
-            cursor.execute('SELECT product_type, COUNT(*) FROM user_data GROUP BY product_type')
-            by_product = cursor.fetchall()
-            conn.close()
-            return total_count, dict(by_product)
-        except Exception as e:
-            return 0, {}
+        if self._product_counts is None:
+            try:
+                # One pass over the product_type index; the total is the sum of the groups
+                self._product_counts = Counter(dict(self._conn.execute(SQL_COUNT_BY_PRODUCT).fetchall()))
+            except Exception as e:
+                return 0, {}
+        return sum(self._product_counts.values()), dict(self._product_counts)
 
     def update_db_stats(self):
         """Update database statistics display."""
         total_count, by_product = self.get_db_stats()
         if total_count > 0:
             product_info = ", ".join([f"{prod}: {count}" for prod, count in by_product.items()])
-            self.db_stats_var.set(f"💾 Database: {total_count} total records ({product_info})")
+            self.db_stats_label.config(text=f"💾 Database: {total_count} total records ({product_info})")
         else:
-            self.db_stats_var.set("💾 Database: Empty")
+            self.db_stats_label.config(text="💾 Database: Empty")
+
+    def schedule_stats_refresh(self):
+        """Queue a status/database label refresh; calls within 200 ms share one refresh."""
+        if not self._stats_refresh_pending:
+            self._stats_refresh_pending = True
+            self.root.after(200, self.refresh_stats)
+
+    def refresh_stats(self):
+        """Update the status and database statistics labels."""
+        self._stats_refresh_pending = False
+        self.update_status()
+        self.update_db_stats()
 
     def setup_ui(self):
         """Set up the main user interface with enhanced styling."""
@@ -129,14 +662,13 @@ class AIMDemoGUI:
         subtitle_label.pack()
         status_frame = tk.Frame(self.root, bg="#ecf0f1", relief="flat", bd=1)
         status_frame.pack(fill="x", padx=20, pady=10)
-        self.status_var = tk.StringVar()
+        # Labels are configured directly; each has a single writer, so no StringVar traces are needed
+        self.status_label = tk.Label(status_frame, font=("Segoe UI", 11), fg="#2c3e50", bg="#ecf0f1")
+        self.status_label.pack(pady=8)
         self.update_status()
-        status_label = tk.Label(status_frame, textvariable=self.status_var, font=("Segoe UI", 11), fg="#2c3e50", bg="#ecf0f1")
-        status_label.pack(pady=8)
-        self.db_stats_var = tk.StringVar()
+        self.db_stats_label = tk.Label(status_frame, font=("Segoe UI", 10), fg="#27ae60", bg="#ecf0f1")
+        self.db_stats_label.pack(pady=2)
         self.update_db_stats()
-        db_stats_label = tk.Label(status_frame, textvariable=self.db_stats_var, font=("Segoe UI", 10), fg="#27ae60", bg="#ecf0f1")
-        db_stats_label.pack(pady=2)
         buttons_container = tk.Frame(self.root, bg="#f0f4f8")
         buttons_container.pack(pady=10, padx=20, fill="x")
         buttons_header = tk.Label(buttons_container, text="📋 Select an Operation", font=("Segoe UI", 12, "bold"), fg="#2c3e50", bg="#f0f4f8")
@@ -144,14 +676,13 @@ class AIMDemoGUI:
         buttons_frame = tk.Frame(buttons_container, bg="#ffffff", relief="raised", bd=1)
         buttons_frame.pack(pady=5, padx=10, fill="x")
         buttons_frame.configure(bg="#ffffff", padx=10, pady=10)
-        self.create_button(buttons_frame, "📝 Add JSON Data", self.enter_custom_data, 0, 0, "#3498db", "#2980b9")
-        self.create_button(buttons_frame, "📦 Bulk JSON Load", self.bulk_json_load, 0, 1, "#9b59b6", "#8e44ad")
-        self.create_button(buttons_frame, "📊 Life Field Mapping", lambda: self.show_field_mapping_with_loading("life"), 0, 2, "#e67e22", "#d35400")
-        self.create_button(buttons_frame, "📋 View Stored Data", self.show_stored_data, 1, 0, "#1abc9c", "#16a085")
-        self.create_button(buttons_frame, "🔍 Check Duplicates", self.show_duplicate_check, 1, 1, "#f39c12", "#e67e22")
-        self.create_button(buttons_frame, "📊 Annuity Field Mapping", lambda: self.show_field_mapping_with_loading("annuity"), 1, 2, "#8e44ad", "#7d3c98")
-        self.create_button(buttons_frame, "❓ Help", self.show_help, 2, 0, "#34495e", "#2c3e50")
-        self.create_button(buttons_frame, "🗑️ Clear Database", self.clear_database, 2, 1, "#e74c3c", "#c0392b")
+        self.root.bind_class(HOVER_BUTTON_TAG, "<Enter>", self._on_button_enter)
+        self.root.bind_class(HOVER_BUTTON_TAG, "<Leave>", self._on_button_leave)
+        for text, method_name, argument, row, col, bg_color, hover_color in _BUTTONS:
+            command = getattr(self, method_name)
+            if argument is not None:
+                command = partial(command, argument)
+            self.create_button(buttons_frame, text, command, row, col, bg_color, hover_color)
         results_container = tk.Frame(self.root, bg="#f0f4f8")
         results_container.pack(padx=20, pady=(5, 15), fill="both", expand=True)
         results_header_frame = tk.Frame(results_container, bg="#34495e", height=35)
@@ -170,10 +701,12 @@ class AIMDemoGUI:
 
     def update_status(self):
         """Update the status display."""
-        if self.user_data_store:
-            self.status_var.set(f"📊 Current session: {len(self.user_data_store)} datasets loaded from database")
+        # Count in SQL (cached) so the status line never decodes stored records
+        total_count = self.get_db_stats()[0]
+        if total_count:
+            self.status_label.config(text=f"📊 Current session: {total_count} datasets loaded from database")
         else:
-            self.status_var.set("📊 No data loaded from database yet")
+            self.status_label.config(text="📊 No data loaded from database yet")
 
     def create_button(self, parent, text, command, row, col, bg_color="#3498db", hover_color="#2980b9"):
         """Create a styled button with hover effects and modern design."""
@@ -183,25 +716,53 @@ class AIMDemoGUI:
         btn.grid(row=row, column=col, padx=8, pady=8, sticky="nsew")
         parent.grid_rowconfigure(row, weight=1)
         parent.grid_columnconfigure(col, weight=1)
-        def on_enter(e):
-            btn['bg'] = hover_color
-        def on_leave(e):
-            btn['bg'] = bg_color
-        btn.bind("<Enter>", on_enter)
-        btn.bind("<Leave>", on_leave)
+        # Hover is handled by the shared HOVER_BUTTON_TAG bindings set up in setup_ui
+        self._hover_colors[btn] = (bg_color, hover_color)
+        btn.bindtags((HOVER_BUTTON_TAG,) + btn.bindtags())
         return btn
 
+    def _on_button_enter(self, event):
+        """Switch a create_button button to its hover color."""
+        event.widget['bg'] = self._hover_colors[event.widget][1]
+
+    def _on_button_leave(self, event):
+        """Restore a create_button button's normal color."""
+        event.widget['bg'] = self._hover_colors[event.widget][0]
+
     def log_result(self, message):
-        """Add a message to the results area."""
-        self.results_text.insert(tk.END, f"{message}\n")
-        self.results_text.see(tk.END)
+        """Queue a message for the results area; queued lines are written in one insert when Tk is idle."""
+        self._log_buf.append(message)
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.root.after_idle(self.flush_log)
+
+    def flush_log(self):
+        """Write all queued messages to the results area."""
+        self._log_flush_pending = False
+        if self._log_buf:
+            # Messages beyond the pane's cap would be trimmed right away, so don't insert them
+            self.results_text.insert(tk.END, "\n".join(self._log_buf[-RESULTS_MAX_LINES:]) + "\n")
+            self._log_buf.clear()
+            line_count = int(self.results_text.index("end-1c").split(".")[0])
+            if line_count > RESULTS_MAX_LINES:
+                self.results_text.delete("1.0", f"{line_count - RESULTS_MAX_LINES + 1}.0")
+            self.results_text.see(tk.END)
 
     def clear_results(self):
         """Clear the results area."""
+        self._log_buf.clear()
         self.results_text.delete(1.0, tk.END)
 
     def enter_custom_data(self):
         """Handle entering custom JSON data (save only, no processing)."""
+        # The dialog is built once and then hidden/shown, reset to a blank entry each time
+        dialog = self._custom_dialog
+        if dialog is not None and dialog.winfo_exists():
+            self._custom_dialog_reset()
+            dialog.deiconify()
+            dialog.grab_set()
+            return
+        
         dialog = tk.Toplevel(self.root)
         dialog.title("📝 Add JSON Data")
         dialog.geometry("700x650")
@@ -257,86 +818,19 @@ Ensure all string values are in quotes and numbers are without quotes."""
                                             relief="solid", bd=1)
         text_area.pack(padx=15, pady=10, fill="both", expand=True)
         
+        # The last sample shown as (text, data), so an unedited save can skip re-parsing it
+        original_json = None
+        
         # Enhanced sample data with more comprehensive examples
         def update_sample_data():
+            nonlocal original_json
             product_type = product_var.get()
             text_area.delete(1.0, tk.END)
             
-            if product_type == "life":
-                sample_data = {
-                    "applicant_first_name": "John",
-                    "applicant_last_name": "Doe",
-                    "date_of_birth": "1980-01-15",
-                    "gender": "M",
-                    "marital_status": "Married",
-                    "occupation": "Software Engineer",
-                    "annual_income": 85000,
-                    "coverage_amount": 250000,
-                    "premium_amount": 150.50,
-                    "policy_term": 20,
-                    "beneficiary_name": "Jane Doe",
-                    "beneficiary_relationship": "Spouse",
-                    "health_questions": {
-                        "smoker": False,
-                        "chronic_conditions": "None",
-                        "medications": "None"
-                    },
-                    "contact_info": {
-                        "phone": "555-123-4567",
-                        "email": "john.doe@email.com",
-                        "address": {
-                            "street": "123 Main St",
-                            "city": "Anytown",
-                            "state": "CA",
-                            "zip": "12345"
-                        }
-                    }
-                }
-            elif product_type == "annuity":
-                sample_data = {
-                    "applicant_first_name": "Mary",
-                    "applicant_last_name": "Johnson",
-                    "date_of_birth": "1965-08-22",
-                    "gender": "F",
-                    "retirement_age": 65,
-                    "initial_deposit": 50000,
-                    "monthly_contribution": 500,
-                    "annuity_type": "Fixed",
-                    "payout_option": "Life Only",
-                    "investment_risk_tolerance": "Conservative",
-                    "beneficiary_info": {
-                        "primary_beneficiary": "Robert Johnson",
-                        "relationship": "Spouse",
-                        "percentage": 100
-                    },
-                    "contact_info": {
-                        "phone": "555-987-6543",
-                        "email": "mary.johnson@email.com"
-                    }
-                }
-            else:  # health
-                sample_data = {
-                    "applicant_first_name": "David",
-                    "applicant_last_name": "Wilson",
-                    "date_of_birth": "1985-12-03",
-                    "gender": "M",
-                    "family_size": 4,
-                    "coverage_type": "Family",
-                    "deductible": 2500,
-                    "monthly_premium": 425.75,
-                    "network_preference": "PPO",
-                    "pre_existing_conditions": [],
-                    "prescription_coverage": True,
-                    "dental_coverage": True,
-                    "vision_coverage": False,
-                    "employer_contribution": 300,
-                    "contact_info": {
-                        "phone": "555-456-7890",
-                        "email": "david.wilson@email.com"
-                    }
-                }
-            
-            text_area.insert(tk.END, json.dumps(sample_data, indent=2))
+            sample_data = _SAMPLE_DATA[product_type]
+            sample_text = _sample_json(product_type)
+            text_area.insert(tk.END, sample_text)
+            original_json = (sample_text.strip(), sample_data)
         
         # Load initial empty template instead of sample data
         def load_empty_template():
@@ -349,6 +843,18 @@ Ensure all string values are in quotes and numbers are without quotes."""
         # Load empty template by default
         load_empty_template()
         
+        def hide_dialog():
+            dialog.grab_release()
+            dialog.withdraw()
+        
+        def reset_dialog():
+            product_var.set("life")
+            load_empty_template()
+        
+        dialog.protocol("WM_DELETE_WINDOW", hide_dialog)
+        self._custom_dialog = dialog
+        self._custom_dialog_reset = reset_dialog
+        
         # Note: Sample data update is now manual via "Show Sample" button
         
         # Button frame
@@ -362,25 +868,28 @@ Ensure all string values are in quotes and numbers are without quotes."""
                     messagebox.showerror("Error", "Please enter JSON data")
                     return
                     
-                data = json.loads(json_text)
+                if original_json is not None and original_json[0] == json_text:
+                    data = original_json[1]
+                else:
+                    data = _parse_json_input(json_text)
                 if not data:
                     messagebox.showerror("Error", "JSON data cannot be empty")
                     return
                     
                 success, message = self.save_data_to_db(data, product_var.get())
                 if success:
-                    self.load_data_from_db()
-                    self.update_status()
-                    self.update_db_stats()
+                    self.schedule_stats_refresh()
                     self.log_result(f"✅ {message}")
                     self.log_result(f"📊 Product Type: {product_var.get()}")
                     self.log_result(f"📋 Fields: {len(data)} data fields saved")
-                    dialog.destroy()
+                    hide_dialog()
                     messagebox.showinfo("Success", f"Data saved successfully!\n\nProduct: {product_var.get().title()}\nFields: {len(data)}")
                 else:
                     messagebox.showwarning("Duplicate Data", message)
             except json.JSONDecodeError as e:
                 messagebox.showerror("JSON Error", f"Invalid JSON format:\n\n{str(e)}\n\nPlease check your JSON syntax:\n• Use double quotes for strings\n• No trailing commas\n• Proper bracket matching")
+            except ValueError as e:
+                messagebox.showerror("JSON Error", f"Unsupported JSON value:\n\n{e}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save data:\n{e}")
         
@@ -400,7 +909,7 @@ Ensure all string values are in quotes and numbers are without quotes."""
         tk.Button(button_frame, text="🗑️ Clear", command=clear_data, 
                  bg="#f39c12", fg="white", font=("Arial", 11), relief="raised", bd=2).pack(side="left", padx=8)
         
-        tk.Button(button_frame, text="❌ Cancel", command=dialog.destroy, 
+        tk.Button(button_frame, text="❌ Cancel", command=hide_dialog, 
                  bg="#e74c3c", fg="white", font=("Arial", 11), relief="raised", bd=2).pack(side="left", padx=8)
 
     def bulk_json_load(self):
@@ -479,13 +988,13 @@ Ensure all string values are in quotes and numbers are without quotes."""
         self.log_result(f"🔄 Loading field mapping for {product_type.title()}...")
         self.root.update()  # Force UI update
         
-        try:
-            import pandas as pd
-        except ImportError:
-            self.log_result("❌ Failed to load field mapping: pandas module missing")
+        # Only check that openpyxl is installed; it is imported when the mapping is created,
+        # so the dialog opens without paying for the import
+        if importlib.util.find_spec("openpyxl") is None:
+            self.log_result("❌ Failed to load field mapping: openpyxl module missing")
             messagebox.showerror("Missing Module", 
-                               "pandas module is required for Excel operations.\n"
-                               "Please install it using: pip install pandas openpyxl")
+                               "openpyxl module is required for Excel operations.\n"
+                               "Please install it using: pip install openpyxl")
             return
             
         self.log_result("✅ Field mapping dialog opening...")
@@ -593,7 +1102,8 @@ Ensure all string values are in quotes and numbers are without quotes."""
 
     def show_stored_data(self):
         """Show stored user data with search functionality."""
-        if not self.user_data_store:
+        total_count = self.get_db_stats()[0]
+        if not total_count:
             messagebox.showinfo("No Data", "No user data stored yet. Use 'Add JSON Data' to add data.")
             return
         
@@ -620,7 +1130,7 @@ Ensure all string values are in quotes and numbers are without quotes."""
         header_info_frame = tk.Frame(content_frame, bg="#e8f5e8", relief="flat", bd=1)
         header_info_frame.pack(fill="x", pady=(0, 15))
         
-        tk.Label(header_info_frame, text=f"📋 Database Records - {len(self.user_data_store)} dataset{'s' if len(self.user_data_store) != 1 else ''} stored", 
+        tk.Label(header_info_frame, text=f"📋 Database Records - {total_count} dataset{'s' if total_count != 1 else ''} stored", 
                 font=("Segoe UI", 12, "bold"), fg="#2e7d32", bg="#e8f5e8").pack(pady=10)
         
         # Search frame
@@ -639,10 +1149,10 @@ Ensure all string values are in quotes and numbers are without quotes."""
         search_entry.pack(side="left", padx=5)
         
         def perform_search():
-            self.perform_search(search_var.get(), data_text, status_label)
+            self.perform_search(search_var.get(), records_tree, status_label)
         
         def show_all():
-            self.show_all_data(data_text, status_label)
+            self.show_all_data(records_tree, status_label)
         
         tk.Button(search_content_frame, text="🔍 Search", command=perform_search,
                  bg="#2196F3", fg="white").pack(side="left", padx=5)
@@ -654,18 +1164,42 @@ Ensure all string values are in quotes and numbers are without quotes."""
         status_label = tk.Label(content_frame, text="", font=("Segoe UI", 9), fg="#1976D2", bg="#f8f9fa")
         status_label.pack(pady=5)
         
-        # Data display area
+        # Record list: the Treeview only draws visible rows, so large stores open quickly
+        tree_frame = tk.Frame(content_frame, bg="#ffffff", relief="solid", bd=1)
+        tree_frame.pack(fill="both", expand=True)
+        
+        records_tree = ttk.Treeview(tree_frame, columns=("index", "product_type", "timestamp", "fields"),
+                                    show="headings", height=8)
+        for column, heading, width in (("index", "#", 60), ("product_type", "Product Type", 150),
+                                       ("timestamp", "Timestamp", 200), ("fields", "Fields", 80)):
+            records_tree.heading(column, text=heading)
+            records_tree.column(column, width=width, anchor="w")
+        tree_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=records_tree.yview)
+        records_tree.configure(yscrollcommand=tree_scrollbar.set)
+        records_tree.pack(side="left", fill="both", expand=True, padx=(8, 0), pady=8)
+        tree_scrollbar.pack(side="right", fill="y", pady=8)
+        
+        # Detail pane: JSON for the selected record only
         text_frame = tk.Frame(content_frame, bg="#ffffff", relief="solid", bd=1)
-        text_frame.pack(fill="both", expand=True, pady=(0, 15))
+        text_frame.pack(fill="both", expand=True, pady=(10, 15))
         
-        data_text = scrolledtext.ScrolledText(text_frame, height=18, width=85, wrap=tk.WORD,
+        data_text = scrolledtext.ScrolledText(text_frame, height=10, width=85, wrap=tk.WORD,
                                             font=("Consolas", 9), bg="#ffffff", fg="#2c3e50",
                                             insertbackground="#2c3e50", selectbackground="#3498db",
                                             relief="solid", bd=1)
         data_text.pack(fill="both", expand=True, padx=8, pady=8)
+        data_text.insert(tk.END, "Select a record above to view its data.")
+        
+        def show_selected(event):
+            selection = records_tree.selection()
+            if selection:
+                data_text.delete(1.0, tk.END)
+                data_text.insert(tk.END, _dumps_pretty(self.get_record_data(int(selection[0]))))
+        
+        records_tree.bind("<<TreeviewSelect>>", show_selected)
         
         # Initially show all data
-        self.show_all_data(data_text, status_label)
+        self.show_all_data(records_tree, status_label)
         
         # Enable Enter key for search
         search_entry.bind('<Return>', lambda event: perform_search())
@@ -684,7 +1218,8 @@ Ensure all string values are in quotes and numbers are without quotes."""
 
     def show_duplicate_check(self):
         """Show duplicate name checker dialog."""
-        if not self.user_data_store:
+        total_count = self.get_db_stats()[0]
+        if not total_count:
             messagebox.showinfo("No Data", "No data available to check for duplicates.")
             return
             
@@ -713,7 +1248,7 @@ Ensure all string values are in quotes and numbers are without quotes."""
         
         duplicates = self.check_for_duplicate_names()
         
-        tk.Label(summary_frame, text=f"📊 Analysis Summary - {len(self.user_data_store)} total records", 
+        tk.Label(summary_frame, text=f"📊 Analysis Summary - {total_count} total records", 
                 font=("Segoe UI", 12, "bold"), fg="#2e7d32", bg="#e8f5e8").pack(pady=10)
         
         if duplicates:
@@ -733,18 +1268,21 @@ Ensure all string values are in quotes and numbers are without quotes."""
         text_area = scrolledtext.ScrolledText(results_frame, width=80, height=25, font=("Consolas", 9))
         text_area.pack(fill="both", expand=True)
         
+        # Build the whole report first and hand it to Tk in a single insert
+        parts = []
         if duplicates:
             for pattern, records in duplicates.items():
-                text_area.insert(tk.END, f"\n🔍 Duplicate Pattern: {pattern}\n")
-                text_area.insert(tk.END, f"   Found in {len(records)} records:\n")
+                parts.append(f"\n🔍 Duplicate Pattern: {pattern}\n")
+                parts.append(f"   Found in {len(records)} records:\n")
                 for i, record in enumerate(records, 1):
-                    text_area.insert(tk.END, f"   {i}. Product: {record['product_type']} | Timestamp: {record['timestamp']}\n")
-                    text_area.insert(tk.END, f"      Data: {json.dumps(record['data'], indent=6)}\n")
-                text_area.insert(tk.END, "-" * 80 + "\n")
+                    parts.append(f"   {i}. Product: {record['product_type']} | Timestamp: {record['timestamp']}\n")
+                    parts.append(f"      Data: {json.dumps(record['data'], indent=6)}\n")
+                parts.append("-" * 80 + "\n")
         else:
-            text_area.insert(tk.END, "✅ No duplicate names found in the database.\n\n")
-            text_area.insert(tk.END, "All records have unique name combinations.\n")
-            text_area.insert(tk.END, "This indicates good data quality with no obvious duplicates.")
+            parts.append("✅ No duplicate names found in the database.\n\n")
+            parts.append("All records have unique name combinations.\n")
+            parts.append("This indicates good data quality with no obvious duplicates.")
+        text_area.insert(tk.END, "".join(parts))
         
         # Close button
         tk.Button(content_frame, text="✅ Close", command=dialog.destroy,
@@ -949,30 +1487,53 @@ Ensure all string values are in quotes and numbers are without quotes."""
 
     def clear_database(self):
         """Clear all data from the database."""
+        if self._pending_writes:
+            # Clearing would wait on (or fail against) the writer thread's open batch
+            messagebox.showinfo("Clear Database", "A bulk save is still running.\n"
+                                "Please clear the database once it has finished.")
+            return
         result = messagebox.askyesno("Clear Database", 
                                    "Are you sure you want to clear all data?\nThis action cannot be undone.")
         if result:
             try:
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
-                cursor.execute('DELETE FROM user_data')
-                conn.commit()
-                conn.close()
-                
-                self.load_data_from_db()
-                self.update_status()
-                self.update_db_stats()
-                self.clear_results()
-                self.log_result("🗑️ Database cleared successfully!")
-                messagebox.showinfo("Success", "Database cleared successfully!")
+                self._conn.execute(SQL_CLEAR)
             except Exception as e:
                 messagebox.showerror("Database Error", f"Failed to clear database: {e}")
+                return
+            # The DELETE has committed, so the rows are gone whatever VACUUM does
+            self._product_counts = Counter()
+            self.schedule_stats_refresh()
+            self.clear_results()
+            try:
+                # Give the freed pages back so the file and later scans shrink
+                self._conn.execute('VACUUM')
+            except Exception as e:
+                self.log_result(f"⚠️ Could not compact the database file: {e}")
+            self.log_result("🗑️ Database cleared successfully!")
+            messagebox.showinfo("Success", "Database cleared successfully!")
 
     def run(self):
         """Start the GUI application."""
-        self.root.protocol("WM_DELETE_WINDOW", self.root.quit)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         self.root.mainloop()
 
+    def _on_close(self):
+        """Finish queued writes, close the database connections and leave the main loop."""
+        self._writeq.put(None)
+        self._wait_for_writer()
+
+    def _wait_for_writer(self):
+        """Poll until the writer thread exits, then close the connections and quit."""
+        # Polled rather than joined so the main loop keeps running queued callbacks
+        if self._writer.is_alive():
+            self.root.after(50, self._wait_for_writer)
+            return
+        # Results the writer posted last still get their callbacks
+        self._run_posted_callbacks()
+        self._writer_conn.close()
+        self._conn.close()
+        self.root.quit()
+
     def browse_save_excel(self, path_var):
         """Browse for Excel file save location."""
         try:
@@ -1009,9 +1570,7 @@ Ensure all string values are in quotes and numbers are without quotes."""
             if filename:
                 # Quick validation
                 try:
-                    import pandas as pd
-                    df_test = pd.read_excel(filename, nrows=1)
-                    if df_test.empty or len(df_test.columns) == 0:
+                    if not _read_header_row(filename):
                         messagebox.showwarning("File Warning", 
                                              "Excel file appears to be empty or has no columns.")
                 except Exception as e:
@@ -1063,48 +1622,17 @@ Ensure all string values are in quotes and numbers are without quotes."""
             return
             
         try:
-            import pandas as pd
-            
-            # Sample template structure
-            template_data = {
-                'Product_Type': ['life', 'annuity', 'health'],
-                'Applicant_First_Name': ['John', 'Jane', 'Bob'],
-                'Applicant_Last_Name': ['Doe', 'Smith', 'Johnson'],
-                'Date_of_Birth': ['1980-01-15', '1975-03-22', '1990-08-10'],
-                'Gender': ['M', 'F', 'M'],
-                'Coverage_Amount': [250000, 150000, 300000],
-                'Premium_Amount': [150.50, 89.25, 200.75]
-            }
-            
-            df_template = pd.DataFrame(template_data)
-            
-            with pd.ExcelWriter(template_path, engine='openpyxl') as writer:
-                df_template.to_excel(writer, sheet_name='Data_Entry', index=False)
-                
-                # Instructions sheet
-                instructions = {
-                    'Field': ['Product_Type', 'Applicant_First_Name', 'Applicant_Last_Name', 
-                             'Date_of_Birth', 'Gender', 'Coverage_Amount', 'Premium_Amount'],
-                    'Description': [
-                        'Insurance product type (life, annuity, health)',
-                        'First name of the applicant',
-                        'Last name of the applicant', 
-                        'Birth date in YYYY-MM-DD format',
-                        'Gender (M/F)',
-                        'Coverage amount in dollars',
-                        'Premium amount in dollars'
-                    ],
-                    'Required': ['Yes', 'Yes', 'Yes', 'Yes', 'Yes', 'Yes', 'Yes']
-                }
-                df_instructions = pd.DataFrame(instructions)
-                df_instructions.to_excel(writer, sheet_name='Instructions', index=False)
+            # The template never changes, so its workbook is built once and reused
+            template_bytes = _bulk_template_bytes()
+            with open(template_path, 'wb') as f:
+                f.write(template_bytes)
             
             parent_dialog.destroy()
             self.log_result(f"✅ Bulk template created: {template_path}")
             messagebox.showinfo("Success", f"Template created successfully!\n\nLocation: {template_path}\n\nFill in your data and use 'Upload Data' to import.")
             
         except ImportError:
-            messagebox.showerror("Missing Module", "pandas module required for Excel operations")
+            messagebox.showerror("Missing Module", "openpyxl module required for Excel operations")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to create template: {e}")
 
@@ -1114,69 +1642,83 @@ Ensure all string values are in quotes and numbers are without quotes."""
             messagebox.showerror("Error", "Please select an Excel file to upload")
             return
             
-        try:
-            import pandas as pd
-            
-            # Show initial loading message
-            self.clear_results()
-            self.log_result("🔄 Starting bulk data upload process...")
-            self.log_result("📂 Reading Excel file...")
-            self.root.update()  # Force UI update
-            
-            # Read the Excel file
-            df = pd.read_excel(upload_path, sheet_name='Data_Entry')
-            
-            if df.empty:
-                self.log_result("❌ Upload failed: Excel file is empty")
-                messagebox.showerror("Error", "Excel file is empty")
-                return
-            
-            self.log_result(f"✅ Excel file loaded successfully - {len(df)} rows found")
-            parent_dialog.destroy()
-            
-            self.log_result("🔄 Processing and validating data...")
-            self.root.update()
-            
-            # Process and preview data first
-            processed_data = []
-            error_count = 0
-            
-            for index, row in df.iterrows():
-                try:
-                    # Convert row to dictionary
-                    data = {}
-                    for col in df.columns:
-                        value = row[col]
-                        if pd.notna(value):  # Skip NaN values
-                            data[col.lower().replace(' ', '_')] = value
+        # Show initial loading message
+        self.clear_results()
+        self.log_result("🔄 Starting bulk data upload process...")
+        self.log_result("📂 Reading and validating Excel rows...")
+        
+        # Parse the workbook off the Tk thread
+        self.run_in_background(self.read_bulk_upload, (upload_path,),
+                               lambda result: self._finish_bulk_upload(result, upload_path, parent_dialog))
+
+    def read_bulk_upload(self, upload_path):
+        """
+        Read the Data_Entry sheet of a filled bulk template.
+
+        Returns (row_count, processed_data, row_errors) where row_errors lists
+        (row_number, exception) for rows that could not be converted.
+        """
+        # Stream the sheet row by row instead of building a DataFrame
+        rows = _iter_sheet_rows(upload_path, 'Data_Entry')
+        header = next(rows, ())
+        # Normalize the column names once; untitled columns are skipped
+        columns = [str(col).lower().replace(' ', '_') if col is not None else None for col in header]
+        
+        processed_data = []
+        row_errors = []
+        row_count = 0
+        
+        for index, row in enumerate(rows):
+            row_count += 1
+            try:
+                # Convert row to dictionary, skipping blank cells
+                data = {col: value for col, value in zip(columns, row)
+                        if col is not None and value is not None}
+                
+                if not data:
+                    continue
                     
-                    if not data:
-                        continue
-                        
-                    # Get product type
-                    product_type = data.get('product_type', 'life')
+                # Get product type
+                product_type = data.get('product_type', 'life')
+                
+                processed_data.append({
+                    'data': data,
+                    'product_type': product_type,
+                    'row_number': index + 1
+                })
                     
-                    processed_data.append({
-                        'data': data,
-                        'product_type': product_type,
-                        'row_number': index + 1
-                    })
-                        
-                except Exception as e:
-                    error_count += 1
-                    self.log_result(f"⚠️ Error processing row {index + 1}: {e}")
-            
-            if not processed_data:
-                messagebox.showerror("Error", "No valid data found in Excel file")
-                return
-            
-            # Show preview dialog with save option
-            self.show_bulk_preview_dialog(processed_data, error_count, upload_path)
-            
-        except ImportError:
-            messagebox.showerror("Missing Module", "pandas module required for Excel operations")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to process upload: {e}")
+            except Exception as e:
+                row_errors.append((index + 1, e))
+        
+        return row_count, processed_data, row_errors
+
+    def _finish_bulk_upload(self, result, upload_path, parent_dialog):
+        """Report a read bulk upload and open its preview, back on the Tk thread."""
+        if isinstance(result, ImportError):
+            messagebox.showerror("Missing Module", "openpyxl module required for Excel operations")
+            return
+        if isinstance(result, Exception):
+            messagebox.showerror("Error", f"Failed to process upload: {result}")
+            return
+        
+        row_count, processed_data, row_errors = result
+        for row_number, e in row_errors:
+            self.log_result(f"⚠️ Error processing row {row_number}: {e}")
+        
+        if not row_count:
+            self.log_result("❌ Upload failed: Excel file is empty")
+            messagebox.showerror("Error", "Excel file is empty")
+            return
+        
+        self.log_result(f"✅ Excel file loaded successfully - {row_count} rows found")
+        parent_dialog.destroy()
+        
+        if not processed_data:
+            messagebox.showerror("Error", "No valid data found in Excel file")
+            return
+        
+        # Show preview dialog with save option
+        self.show_bulk_preview_dialog(processed_data, len(row_errors), upload_path)
 
     def show_bulk_preview_dialog(self, processed_data, error_count, upload_path):
         """Show preview of bulk data with option to save to database."""
@@ -1256,7 +1798,7 @@ Ensure all string values are in quotes and numbers are without quotes."""
         # Display preview data
         for i, record in enumerate(processed_data[:10], 1):  # Show first 10 records
             preview_text.insert(tk.END, f"\n--- Record {record['row_number']} (Product: {record['product_type']}) ---\n")
-            preview_text.insert(tk.END, json.dumps(record['data'], indent=2))
+            preview_text.insert(tk.END, _dumps_pretty(record['data']))
             preview_text.insert(tk.END, "\n" + "-" * 60 + "\n")
         
         if len(processed_data) > 10:
@@ -1335,26 +1877,33 @@ Ensure all string values are in quotes and numbers are without quotes."""
         self.clear_results()
         self.log_result("💾 Saving bulk data to database...")
         
+        records = [(record['data'], record['product_type']) for record in processed_data]
+        self.submit_write(self._insert_many, (self._writer_conn, records),
+                          lambda result: self._finish_bulk_save(processed_data, result))
+
+    def _finish_bulk_save(self, processed_data, result):
+        """Report a bulk save once the writer thread hands back its result."""
         success_count = 0
         duplicate_count = 0
-        error_count = 0
         
-        for record in processed_data:
-            try:
-                success, message = self.save_data_to_db(record['data'], record['product_type'])
-                if success:
-                    success_count += 1
-                else:
-                    duplicate_count += 1
-                    
-            except Exception as e:
-                error_count += 1
-                self.log_result(f"⚠️ Error saving row {record['row_number']}: {e}")
+        if isinstance(result, Exception):
+            error_count = len(processed_data)
+            self.log_result(f"⚠️ Error saving bulk data: {result}")
+        else:
+            success_count, duplicate_count, errors, failure = result
+            error_count = len(errors)
+            if success_count:
+                # The writer thread leaves the counts cache alone; recount on the next read
+                self._product_counts = None
+            for position, e in errors:
+                self.log_result(f"⚠️ Error saving row {processed_data[position]['row_number']}: {e}")
+            if failure is not None:
+                # Batches committed before the failure stay saved; the rest count as errors
+                error_count = len(processed_data) - success_count - duplicate_count
+                self.log_result(f"⚠️ Error saving bulk data: {failure}")
         
         # Update display
-        self.load_data_from_db()
-        self.update_status()
-        self.update_db_stats()
+        self.schedule_stats_refresh()
         
         # Show results
         self.log_result(f"✅ Bulk save completed!")
@@ -1370,142 +1919,145 @@ Ensure all string values are in quotes and numbers are without quotes."""
                            f"Check the results area for detailed logs.")
     def create_excel_mapping(self, product_type, output_path, calculator_path):
         """Create Excel mapping file with FAST UI to Actuarial Calculator field mapping."""
+        self.clear_results()
+        self.log_result("🔄 Creating Excel field mapping...")
+        self.log_result("📋 Initializing field mapping process...")
+        
+        # The processor load and the workbook I/O run off the Tk thread
+        self.run_in_background(self.write_excel_mapping, (product_type, output_path, calculator_path),
+                               lambda result: self._finish_excel_mapping(result, output_path))
+
+    def write_excel_mapping(self, product_type, output_path, calculator_path):
+        """
+        Build and write the mapping workbook; returns the number of fields mapped.
+
+        Runs on a worker thread, so progress goes through the result queue the Tk thread drains.
+        """
+        log = partial(self._post_result, self.log_result)
+        
+        # Get FAST UI fields from the processor
+        log("🔍 Retrieving FAST UI field mappings...")
         try:
-            import pandas as pd
-            import os
-            
-            self.clear_results()
-            self.log_result("🔄 Creating Excel field mapping...")
-            self.log_result("📋 Initializing field mapping process...")
-            self.root.update()  # Force UI update
-            
-            # Get FAST UI fields from the processor
-            self.log_result("🔍 Retrieving FAST UI field mappings...")
-            self.root.update()
-            try:
-                mappings = self.processor.mapper.get_mapping_summary(product_type)
-                if not mappings:
-                    self.log_result("⚠️ No field mappings found for this product type")
-                    mappings = {"sample_field": "Sample Value"}
-                else:
-                    self.log_result(f"✅ Found {len(mappings)} FAST UI fields")
-            except Exception as e:
-                self.log_result(f"⚠️ Could not get mappings from processor: {e}")
-                self.log_result("📋 Using sample field mappings instead...")
-                # Use sample mappings
-                mappings = {
-                    "applicant_first_name": "John",
-                    "applicant_last_name": "Doe", 
-                    "date_of_birth": "1980-01-15",
-                    "gender": "M",
-                    "coverage_amount": "250000",
-                    "premium_amount": "150.50"
-                }
-            
-            # Read calculator Excel to get available fields
-            self.log_result("📊 Reading actuarial calculator Excel file...")
-            self.root.update()
-            calculator_fields = []
+            mappings = self.processor.mapper.get_mapping_summary(product_type)
+            if not mappings:
+                log("⚠️ No field mappings found for this product type")
+                mappings = {"sample_field": "Sample Value"}
+            else:
+                log(f"✅ Found {len(mappings)} FAST UI fields")
+        except Exception as e:
+            log(f"⚠️ Could not get mappings from processor: {e}")
+            log("📋 Using sample field mappings instead...")
+            # Use sample mappings
+            mappings = {
+                "applicant_first_name": "John",
+                "applicant_last_name": "Doe", 
+                "date_of_birth": "1980-01-15",
+                "gender": "M",
+                "coverage_amount": "250000",
+                "premium_amount": "150.50"
+            }
+        
+        # Read calculator Excel to get available fields
+        log("📊 Reading actuarial calculator Excel file...")
+        calculator_fields = []
+        try:
+            if os.path.exists(calculator_path):
+                calculator_fields = _read_header_row(calculator_path)
+                log(f"✅ Found {len(calculator_fields)} fields in calculator Excel")
+            else:
+                log("⚠️ Calculator Excel not found, will create template only")
+        except Exception as e:
+            log(f"⚠️ Could not read calculator Excel: {e}")
+            calculator_fields = ["Premium_Amount", "Policy_Number", "Insured_Name", 
+                               "Coverage_Amount", "Policy_Date", "Birth_Date", "Gender"]
+        
+        # Create mapping data
+        log("🔗 Creating field mapping suggestions...")
+        # Build the sheet column by column from plain lists
+        ui_fields = list(mappings)
+        mapping_data = {
+            'FAST_UI_Field': ui_fields,
+            'FAST_UI_Value': [str(sample_val) for sample_val in mappings.values()],
+            'Actuarial_Field': [self.suggest_actuarial_field(ui_field, calculator_fields)
+                                for ui_field in ui_fields],
+            # Excel formula pointing at the FAST UI value on the same row (data starts on row 2)
+            'Actuarial_Value': [f"=B{row}" for row in range(2, len(ui_fields) + 2)]
+        }
+        mapped_count = len(ui_fields)
+        
+        log(f"📝 Generated {mapped_count} field mappings")
+        
+        # Create Excel file
+        log("💾 Creating Excel mapping file...")
+        
+        # Main mapping sheet
+        sheets = {'Field_Mapping': mapping_data}
+        
+        # Calculator fields reference sheet
+        if calculator_fields:
+            sheets['Calculator_Fields'] = {'Available_Calculator_Fields': calculator_fields}
+        
+        # Instructions sheet
+        sheets['Instructions'] = {
+            'Step': [1, 2, 3, 4, 5],
+            'Instruction': [
+                'Review FAST UI fields and their sample values',
+                'Verify suggested Actuarial fields match your calculator',
+                'Update Actuarial_Field column with correct field names',
+                'Modify Actuarial_Value column formulas as needed',
+                'Save and use this mapping for data transformation'
+            ]
+        }
+        _write_workbook(output_path, sheets)
+        
+        return mapped_count
+
+    def _finish_excel_mapping(self, result, output_path):
+        """Report a finished mapping and offer to open it, back on the Tk thread."""
+        if isinstance(result, ImportError):
+            messagebox.showerror("Missing Module", 
+                               "openpyxl module is required.\n"
+                               "Please install it using:\npip install openpyxl")
+            return
+        if isinstance(result, Exception):
+            self.log_result(f"❌ Error creating Excel mapping: {result}")
+            messagebox.showerror("Error", f"Failed to create Excel mapping: {result}")
+            return
+        
+        mapped_count = result
+        self.log_result(f"✅ Excel mapping file created successfully!")
+        self.log_result(f"📁 Location: {output_path}")
+        self.log_result(f"📊 Mapped {mapped_count} fields")
+        
+        # Ask to open file
+        open_now = messagebox.askyesno("Success", 
+                                     f"Excel mapping file created successfully!\n\n"
+                                     f"Location: {os.path.basename(output_path)}\n"
+                                     f"Fields mapped: {mapped_count}\n\n"
+                                     f"Would you like to open the file now?")
+        
+        if open_now:
             try:
-                if os.path.exists(calculator_path):
-                    df_calc = pd.read_excel(calculator_path, nrows=5)
-                    calculator_fields = list(df_calc.columns)
-                    self.log_result(f"✅ Found {len(calculator_fields)} fields in calculator Excel")
-                else:
-                    self.log_result("⚠️ Calculator Excel not found, will create template only")
+                self._open_in_shell(output_path)
             except Exception as e:
-                self.log_result(f"⚠️ Could not read calculator Excel: {e}")
-                calculator_fields = ["Premium_Amount", "Policy_Number", "Insured_Name", 
-                                   "Coverage_Amount", "Policy_Date", "Birth_Date", "Gender"]
-            
-            # Create mapping data
-            self.log_result("🔗 Creating field mapping suggestions...")
-            self.root.update()
-            mapping_data = []
-            for ui_field, sample_val in mappings.items():
-                # Suggest actuarial field
-                suggested_calc_field = self.suggest_actuarial_field(ui_field, calculator_fields)
-                
-                mapping_data.append({
-                    'FAST_UI_Field': ui_field,
-                    'FAST_UI_Value': str(sample_val),
-                    'Actuarial_Field': suggested_calc_field,
-                    'Actuarial_Value': f"=B{len(mapping_data)+2}"  # Excel formula
-                })
-            
-            self.log_result(f"📝 Generated {len(mapping_data)} field mappings")
-            self.root.update()
-            
-            # Create Excel file
-            self.log_result("💾 Creating Excel mapping file...")
-            self.root.update()
-            df_mapping = pd.DataFrame(mapping_data)
-            
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                # Main mapping sheet
-                df_mapping.to_excel(writer, sheet_name='Field_Mapping', index=False)
-                
-                # Calculator fields reference sheet
-                if calculator_fields:
-                    calc_ref_data = {'Available_Calculator_Fields': calculator_fields}
-                    df_calc_ref = pd.DataFrame(calc_ref_data)
-                    df_calc_ref.to_excel(writer, sheet_name='Calculator_Fields', index=False)
-                
-                # Instructions sheet
-                instructions_data = {
-                    'Step': [1, 2, 3, 4, 5],
-                    'Instruction': [
-                        'Review FAST UI fields and their sample values',
-                        'Verify suggested Actuarial fields match your calculator',
-                        'Update Actuarial_Field column with correct field names',
-                        'Modify Actuarial_Value column formulas as needed',
-                        'Save and use this mapping for data transformation'
-                    ]
-                }
-                df_instructions = pd.DataFrame(instructions_data)
-                df_instructions.to_excel(writer, sheet_name='Instructions', index=False)
-            
-            self.log_result(f"✅ Excel mapping file created successfully!")
-            self.log_result(f"📁 Location: {output_path}")
-            self.log_result(f"📊 Mapped {len(mapping_data)} fields")
-            
-            # Ask to open file
-            result = messagebox.askyesno("Success", 
-                                       f"Excel mapping file created successfully!\n\n"
-                                       f"Location: {os.path.basename(output_path)}\n"
-                                       f"Fields mapped: {len(mapping_data)}\n\n"
-                                       f"Would you like to open the file now?")
-            
-            if result:
-                try:
-                    os.startfile(output_path)  # Windows
-                except Exception as e:
-                    self.log_result(f"ℹ️ Cannot auto-open file: {e}")
-                    
-        except ImportError:
-            messagebox.showerror("Missing Module", 
-                               "pandas and openpyxl modules are required.\n"
-                               "Please install them using:\npip install pandas openpyxl")
-        except Exception as e:
-            self.log_result(f"❌ Error creating Excel mapping: {e}")
-            messagebox.showerror("Error", f"Failed to create Excel mapping: {e}")
+                self.log_result(f"ℹ️ Cannot auto-open file: {e}")
+
+    def _open_in_shell(self, path):
+        """Open a file with its default application without waiting for it to start."""
+        if sys.platform == "win32":
+            os.startfile(path)  # ShellExecute returns once the launch is handed off
+        elif sys.platform == "darwin":
+            subprocess.Popen(["open", path], close_fds=True)
+        else:
+            subprocess.Popen(["xdg-open", path], close_fds=True)
 
     def suggest_actuarial_field(self, fast_ui_field, calculator_fields):
         """Suggest actuarial field based on FAST UI field name."""
-        # Simple mapping suggestions
-        suggestions = {
-            'first_name': 'Insured_First_Name',
-            'last_name': 'Insured_Last_Name',
-            'date_of_birth': 'Birth_Date',
-            'coverage_amount': 'Coverage_Amount',
-            'premium_amount': 'Premium_Amount',
-            'gender': 'Gender',
-            'policy_number': 'Policy_Number'
-        }
+        field_name = fast_ui_field.lower()
         
         # Check for direct matches first
-        for key, value in suggestions.items():
-            if key in fast_ui_field.lower():
+        for key, value in _FIELD_SUGGESTIONS:
+            if key in field_name:
                 if value in calculator_fields:
                     return value
                 break
@@ -1515,80 +2067,47 @@ Ensure all string values are in quotes and numbers are without quotes."""
         
     def check_for_duplicate_names(self):
         """Check for duplicate names in the stored data and return a report."""
-        name_patterns = {}
-        
-        for record in self.user_data_store:
-            data = record['data']
-            
-            # Extract name fields
-            first_name = str(data.get('applicant_first_name', data.get('first_name', ''))).lower().strip()
-            last_name = str(data.get('applicant_last_name', data.get('last_name', ''))).lower().strip()
-            
-            if first_name and last_name:
-                name_key = f"{first_name} {last_name}"
-                
-                if name_key not in name_patterns:
-                    name_patterns[name_key] = []
-                name_patterns[name_key].append(record)
-        
-        # Find duplicates
+        # SQLite finds the repeated name keys; only the matching rows are decoded
         duplicates = {}
-        for name, records in name_patterns.items():
-            if len(records) > 1:
-                duplicates[name] = records
+        for name_key, product_type, json_data, timestamp in self._conn.execute(SQL_DUPLICATE_NAMES):
+            duplicates.setdefault(name_key, []).append(
+                {'product_type': product_type, 'data': _loads(json_data), 'timestamp': timestamp})
         
         return duplicates
 
-    def perform_search(self, search_term, data_text, status_label):
+    def _fill_records_tree(self, records_tree, records):
+        """Replace the Treeview rows with find_records() rows; the iid is the database row id."""
+        records_tree.delete(*records_tree.get_children())
+        for position, record_id, product_type, timestamp, field_count in records:
+            records_tree.insert("", "end", iid=str(record_id),
+                                values=(position, product_type, timestamp, field_count))
+
+    def perform_search(self, search_term, records_tree, status_label):
         """Perform search in stored data."""
         if not search_term.strip():
-            self.show_all_data(data_text, status_label)
+            self.show_all_data(records_tree, status_label)
             return
         
-        data_text.delete(1.0, tk.END)
+        # Search in product type, timestamp, and JSON data
+        matches = self.find_records(search_term)
         search_term = search_term.lower()
-        matches = []
-        
-        for i, data_entry in enumerate(self.user_data_store, 1):
-            # Search in product type, timestamp, and JSON data
-            searchable_content = (
-                data_entry['product_type'].lower() + " " +
-                data_entry['timestamp'].lower() + " " +
-                json.dumps(data_entry['data']).lower()
-            )
-            
-            if search_term in searchable_content:
-                matches.append((i, data_entry))
         
+        self._fill_records_tree(records_tree, matches)
         if matches:
             status_label.config(text=f"Found {len(matches)} matching record(s)", fg="green")
-            for original_index, data_entry in matches:
-                data_text.insert(tk.END, f"\n{original_index}. Product Type: {data_entry['product_type']}\n")
-                data_text.insert(tk.END, f"   Timestamp: {data_entry['timestamp']}\n")
-                data_text.insert(tk.END, f"   Data: {json.dumps(data_entry['data'], indent=2)}\n")
-                data_text.insert(tk.END, "-" * 60 + "\n")
         else:
-            status_label.config(text="No matching records found", fg="red")
-            data_text.insert(tk.END, f"\nNo records found matching '{search_term}'\n\nTry searching for:\n")
-            data_text.insert(tk.END, "• Product type (life, annuity, health)\n")
-            data_text.insert(tk.END, "• Names (first_name, last_name)\n")
-            data_text.insert(tk.END, "• Date values\n")
-            data_text.insert(tk.END, "• Any field values in the JSON data\n")
-
-    def show_all_data(self, data_text, status_label):
+            status_label.config(text=f"No records found matching '{search_term}' - try a product type, "
+                                     "name, date or any field value", fg="red")
+
+    def show_all_data(self, records_tree, status_label):
         """Show all stored data."""
-        data_text.delete(1.0, tk.END)
-        status_label.config(text=f"Showing all {len(self.user_data_store)} records", fg="blue")
-        
-        for i, entry in enumerate(self.user_data_store, 1):
-            data_text.insert(tk.END, f"{i}. Product Type: {entry['product_type']}\n")
-            data_text.insert(tk.END, f"   Timestamp: {entry['timestamp']}\n")
-            data_text.insert(tk.END, f"   Data: {json.dumps(entry['data'], indent=2)}\n")
-            data_text.insert(tk.END, "-" * 60 + "\n")
+        records = self.find_records()
+        status_label.config(text=f"Showing all {len(records)} records", fg="blue")
+        self._fill_records_tree(records_tree, records)
 
     def export_data_to_file(self):
-        """Export all stored data to a JSON file."""
-        if not self.user_data_store:
+        """Export all stored data to a JSON or JSON Lines file."""
+        if not self.get_db_stats()[0]:
             messagebox.showinfo("No Data", "No data available to export.")
             return
             
@@ -1603,12 +2122,15 @@ Ensure all string values are in quotes and numbers are without quotes."""
                 title="Export Data As",
                 initialfile=default_filename,
                 defaultextension=".json",
-                filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+                filetypes=[("JSON files", "*.json"), ("JSON Lines files", "*.jsonl"), ("All files", "*.*")]
             )
             
             if filename:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(self.user_data_store, f, indent=2, ensure_ascii=False)
+                if filename.lower().endswith(".jsonl"):
+                    self.export_jsonl(filename)
+                else:
+                    with open(filename, 'w', encoding='utf-8') as f:
+                        f.write(_dumps_pretty(self.fetch_all_records()))
                 
                 self.log_result(f"✅ Data exported to: {filename}")
                 messagebox.showinfo("Export Complete", f"Data successfully exported to:\n{filename}")
@@ -1616,6 +2138,19 @@ Ensure all string values are in quotes and numbers are without quotes."""
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export data: {e}")
 
+    def export_jsonl(self, filename):
+        """Write one JSON record per line, streaming rows from SQLite without decoding them."""
+        with open(filename, 'wb') as f:
+            for product_type, timestamp, json_data, is_valid in self._conn.execute(SQL_EXPORT):
+                # json_data is already JSON, so splice it in after the encoded metadata
+                meta = _dumps_bytes({'product_type': product_type, 'timestamp': timestamp})
+                if is_valid:
+                    data = json_data.encode("utf-8")
+                else:
+                    # Legacy rows may hold NaN/Infinity; re-encoding writes them as null
+                    data = _dumps_bytes(_loads(json_data))
+                f.write(meta[:-1] + b',"data":' + data + b'}\n')
+
     def show_field_mapping_with_loading(self, product_type):
         """Wrapper function to show loading message before opening field mapping."""
         # Show immediate loading message
@@ -9,6 +9,10 @@ import os
 import logging
 from typing import Dict, Any, List, Optional
 
+# orjson is a required dependency (see requirements.txt); it parses the raw file
+# bytes in one call, and its JSONDecodeError subclasses json.JSONDecodeError
+from orjson import loads as _loads
+
 
 class ConfigManager:
     """
@@ -88,8 +92,8 @@ class ConfigManager:
         file_path = os.path.join(self.config_path, filename)
         
         try:
-            with open(file_path, 'r') as f:
-                config = json.load(f)
+            with open(file_path, 'rb') as f:
+                config = _loads(f.read())
             self.logger.info(f"Loaded configuration: {filename}")
             return config
         except FileNotFoundError:
@@ -10,6 +10,14 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 
+_LOGGER = logging.getLogger(__name__)
+
+# isinstance(value, dict) / isinstance(value, list) as plain callables, so map()
+# can drive the check in C and loops can bind them as locals
+_is_dict = dict.__instancecheck__
+_is_list = list.__instancecheck__
+
+
 class FastUIParser:
     """
     Parses input data from FAST UI format into a standardized internal format.
@@ -17,7 +25,7 @@ class FastUIParser:
     
     def __init__(self):
         """Initialize the FAST UI Parser."""
-        self.logger = logging.getLogger(__name__)
+        self.logger = _LOGGER
     
     def parse(self, fast_ui_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -33,28 +41,27 @@ class FastUIParser:
             ParsingError: If parsing fails
         """
         try:
-            self.logger.info("Starting FAST UI data parsing")
+            info_enabled = self.logger.isEnabledFor(logging.INFO)
+            if info_enabled:
+                self.logger.info("Starting FAST UI data parsing")
             
-            parsed_data = {}
-            
-            # Handle different FAST UI data structures
-            if self._is_nested_structure(fast_ui_data):
-                parsed_data = self._parse_nested_structure(fast_ui_data)
-            else:
-                parsed_data = self._parse_flat_structure(fast_ui_data)
+            # Single pass over the input handles both flat and nested layouts
+            parsed_data = self._parse_structure(fast_ui_data)
             
             # Clean and normalize data
             cleaned_data = self._clean_data(parsed_data)
+            parsed_fields_count = len(cleaned_data)  # Counted before metadata is added
             
             # Add parsing metadata
             cleaned_data["_parsing_metadata"] = {
-                "parsed_at": datetime.now().isoformat(),
+                "parsed_at": datetime.now().isoformat(timespec="milliseconds"),
                 "original_fields_count": len(fast_ui_data),
-                "parsed_fields_count": len(cleaned_data) - 1,  # Exclude metadata
+                "parsed_fields_count": parsed_fields_count,
                 "parser_version": "1.0.0"
             }
             
-            self.logger.info(f"Successfully parsed {len(cleaned_data)} fields")
+            if info_enabled:
+                self.logger.info(f"Successfully parsed {len(cleaned_data)} fields")
             return cleaned_data
             
         except Exception as e:
@@ -71,61 +78,41 @@ class FastUIParser:
         Returns:
             True if data has nested structure, False otherwise
         """
-        # Check for common nested structure indicators
-        nested_indicators = ["applicant", "policy", "coverage", "beneficiary", "sections"]
-        
-        for indicator in nested_indicators:
-            if indicator in data and isinstance(data[indicator], dict):
-                return True
-        
-        # Check if any values are dictionaries (indicating nesting)
-        for value in data.values():
-            if isinstance(value, dict):
-                return True
-        
-        return False
+        # Check if any values are dictionaries (indicating nesting); any() short-circuits
+        return any(map(_is_dict, data.values()))
     
-    def _parse_nested_structure(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _parse_structure(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Parse nested FAST UI data structure.
+        Parse FAST UI data, flattening nested sections in the same pass.
         
         Args:
-            data: Nested FAST UI data
+            data: Flat or nested FAST UI data
             
         Returns:
             Flattened parsed data
         """
         parsed_data = {}
-        
+        # Bind loop helpers to locals (LOAD_FAST instead of global/attribute lookups)
+        parse_value = self._parse_field_value
+        update = parsed_data.update
+        is_dict = _is_dict
+        is_list = _is_list
+        # Arrays are only expanded into indexed keys for nested payloads; the
+        # check runs in C and stops at the first dict, so flat data is unchanged
+        expand_arrays = self._is_nested_structure(data)
+
         for section_name, section_data in data.items():
-            if isinstance(section_data, dict):
-                # Flatten nested sections with prefixes
-                for field_name, field_value in section_data.items():
-                    flattened_key = f"{section_name}_{field_name}"
-                    parsed_data[flattened_key] = self._parse_field_value(field_value)
-            elif isinstance(section_data, list):
+            if is_dict(section_data):
+                # Flatten nested sections with prefixes, building the prefix once per section
+                prefix = section_name + "_"
+                update((prefix + field_name, parse_value(field_value))
+                       for field_name, field_value in section_data.items())
+            elif expand_arrays and is_list(section_data):
                 # Handle arrays (e.g., multiple beneficiaries)
-                parsed_data.update(self._parse_array_section(section_name, section_data))
+                update(self._parse_array_section(section_name, section_data))
             else:
                 # Simple field
-                parsed_data[section_name] = self._parse_field_value(section_data)
-        
-        return parsed_data
-    
-    def _parse_flat_structure(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Parse flat FAST UI data structure.
-        
-        Args:
-            data: Flat FAST UI data
-            
-        Returns:
-            Parsed data
-        """
-        parsed_data = {}
-        
-        for field_name, field_value in data.items():
-            parsed_data[field_name] = self._parse_field_value(field_value)
+                parsed_data[section_name] = parse_value(section_data)
         
         return parsed_data
     
@@ -141,15 +128,19 @@ class FastUIParser:
             Flattened data with indexed keys
         """
         parsed_data = {}
-        
-        for index, item in enumerate(array_data):
-            if isinstance(item, dict):
+        setitem = parsed_data.__setitem__
+        parse_value = self._parse_field_value
+        is_dict = _is_dict
+        
+        for index, item in enumerate(array_data, 1):
+            indexed_key = f"{section_name}_{index}"
+            if is_dict(item):
+                # Build the indexed prefix once per item, not once per field
+                prefix = indexed_key + "_"
                 for field_name, field_value in item.items():
-                    indexed_key = f"{section_name}_{index + 1}_{field_name}"
-                    parsed_data[indexed_key] = self._parse_field_value(field_value)
+                    setitem(prefix + field_name, parse_value(field_value))
             else:
-                indexed_key = f"{section_name}_{index + 1}"
-                parsed_data[indexed_key] = self._parse_field_value(item)
+                setitem(indexed_key, parse_value(item))
         
         # Also store the count
         parsed_data[f"{section_name}_count"] = len(array_data)
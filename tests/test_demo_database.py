@@ -0,0 +1,317 @@
+"""
+Tests for the AIMDemoGUI database helpers (hashing and duplicate detection).
+These exercise the SQLite layer directly without opening the Tk window.
+"""
+import sys
+import os
+import json
+import hashlib
+import sqlite3
+import queue
+import orjson
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.example import AIMDemoGUI, _parse_json_input
+
+
+@contextmanager
+def make_gui(db_path):
+    """Yield an AIMDemoGUI with only its database connection opened, closing it afterwards."""
+    gui = AIMDemoGUI.__new__(AIMDemoGUI)
+    gui.db_path = str(db_path)
+    gui.init_database()
+    try:
+        yield gui
+    finally:
+        gui._conn.close()
+
+
+def test_data_hash_is_stable():
+    """The hash must not depend on key order or on the running process."""
+    gui = AIMDemoGUI.__new__(AIMDemoGUI)
+    data = {"applicant_last_name": "Doe", "applicant_first_name": "John", "policy_face_amount": 250000}
+    reordered = dict(reversed(list(data.items())))
+
+    expected = hashlib.blake2b(
+        json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+    assert gui.get_data_hash(data) == expected
+    assert gui.get_data_hash(reordered) == expected
+    # Inserts store exactly the text that was hashed
+    assert gui._encode_record(reordered) == (expected, json.dumps(data, sort_keys=True, separators=(",", ":")))
+
+
+def test_duplicate_rows_are_rejected(tmp_path):
+    """Saving the same payload twice stores a single row."""
+    with make_gui(tmp_path / "aim_test.db") as gui:
+
+        saved, _ = gui.save_data_to_db({"applicant_first_name": "John", "applicant_last_name": "Doe"}, "life")
+        duplicate, _ = gui.save_data_to_db({"applicant_last_name": "Doe", "applicant_first_name": "John"}, "life")
+        other, _ = gui.save_data_to_db({"applicant_first_name": "Jane", "applicant_last_name": "Doe"}, "annuity")
+
+        assert saved and not duplicate and other
+        assert gui.get_db_stats() == (2, {"life": 1, "annuity": 1})
+
+
+def test_unencodable_records_are_reported(tmp_path):
+    """Integers past 64 bits, which orjson can't encode, get a clear error rather than a database one."""
+    with make_gui(tmp_path / "aim_bigint.db") as gui:
+        saved, message = gui.save_data_to_db({"policy_number": 2 ** 70}, "life")
+
+        assert not saved
+        assert message.startswith("Record can't be stored: Integer exceeds 64-bit range")
+        _, _, errors = gui.save_many_to_db([({"policy_number": 2 ** 70}, "life")])
+        assert [(position, type(e)) for position, e in errors] == [(0, ValueError)]
+        assert gui.get_db_stats()[0] == 0
+
+
+def test_dialog_json_keeps_values_exact():
+    """Typed JSON keeps big integers exact and rejects values that can't be stored as entered."""
+    assert _parse_json_input('{"policy_number": 12345678901234567890}') == {"policy_number": 12345678901234567890}
+    for text in ('{"age": NaN}', '{"age": Infinity}', '{"policy_number": 123456789012345678901234}'):
+        try:
+            _parse_json_input(text)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted {text}")
+
+
+def test_cached_stats_follow_writes(tmp_path):
+    """Stats read before a write still reflect single and bulk saves."""
+    with make_gui(tmp_path / "aim_stats.db") as gui:
+        assert gui.get_db_stats() == (0, {})
+
+        gui.save_data_to_db({"applicant_first_name": "John"}, "life")
+        gui.save_data_to_db({"applicant_first_name": "John"}, "life")
+        assert gui.get_db_stats() == (1, {"life": 1})
+
+        gui.save_many_to_db([({"applicant_first_name": "Jane"}, "annuity")])
+        assert gui.get_db_stats() == (2, {"life": 1, "annuity": 1})
+
+
+def test_single_save_records_local_timestamp(tmp_path):
+    """SQLite fills in the timestamp in the same format bulk saves use."""
+    with make_gui(tmp_path / "aim_ts.db") as gui:
+        gui.save_data_to_db({"applicant_first_name": "John"}, "life")
+
+        datetime.strptime(gui.fetch_all_records()[0]['timestamp'], "%Y-%m-%d %H:%M:%S")
+
+
+def test_find_records_searches_in_sql(tmp_path):
+    """Listing and searching run in SQLite and keep each record's save position."""
+    with make_gui(tmp_path / "aim_find.db") as gui:
+        gui.save_data_to_db({"applicant_first_name": "JOSÉ", "applicant_last_name": "Doe"}, "life")
+        gui.save_data_to_db({"applicant_first_name": "Jane", "riders": ["ADB", "WOP"]}, "annuity")
+
+        all_records = gui.find_records("   ")
+        assert [(position, product_type, fields) for position, _, product_type, _, fields in all_records] == [
+            (1, "life", 2), (2, "annuity", 2)]
+
+        [(position, record_id, product_type, _, _)] = gui.find_records("josé")
+        assert (position, product_type) == (1, "life")
+        assert gui.get_record_data(record_id) == {"applicant_first_name": "JOSÉ", "applicant_last_name": "Doe"}
+        assert [row[0] for row in gui.find_records("ANNUITY")] == [2]
+        assert gui.find_records("smith") == []
+
+        # Rows saved by older builds may hold NaN, which SQLite's JSON functions reject
+        gui._conn.execute("INSERT INTO user_data (data_hash, product_type, json_data, timestamp) VALUES (?, ?, ?, ?)",
+                          ("legacy", "life", '{"applicant_first_name":"Ann","age":NaN}', "2025-01-01 00:00:00"))
+        assert [row[4] for row in gui.find_records("")] == [2, 2, 2]
+        assert gui.get_record_data(gui.find_records("2025-01-01")[0][1])["applicant_first_name"] == "Ann"
+
+        # Key/value searches match old json.dumps rows and new compact rows alike
+        gui._conn.execute("INSERT INTO user_data (data_hash, product_type, json_data, timestamp) VALUES (?, ?, ?, ?)",
+                          ("spaced", "life", json.dumps({"gender": "M"}), "2025-01-01 00:00:00"))
+        gui.save_data_to_db({"gender": "m", "age": 40}, "life")
+        for term in ('"gender": "m"', '"gender":"m"'):
+            assert [row[2] for row in gui.find_records(term)] == ["life", "life"]
+
+
+def test_save_many_batches_and_skips_duplicates(tmp_path):
+    """Bulk saves insert across batch boundaries and count duplicates."""
+    with make_gui(tmp_path / "aim_bulk.db") as gui:
+        records = [({"applicant_first_name": f"Person{i % 150}"}, "life") for i in range(300)]
+
+        saved, duplicates, errors = gui.save_many_to_db(records, batch_size=64)
+
+        assert (saved, duplicates, errors) == (150, 150, [])
+        assert gui.get_db_stats()[0] == 150
+
+
+def start_writer(gui):
+    """Give a make_gui() instance the writer thread and queues __init__ would set up."""
+    gui._writer_conn = gui._connect()
+    gui._writeq = queue.Queue()
+    gui._resultq = queue.Queue()
+    gui._pending_writes = 0
+    gui._writer = threading.Thread(target=gui._writer_loop)
+    gui._writer.start()
+
+
+def test_writer_thread_runs_queued_saves(tmp_path):
+    """Queued writes run on the writer thread and post their results for the Tk thread."""
+    with make_gui(tmp_path / "aim_writer.db") as gui:
+        results = []
+        start_writer(gui)
+        gui.submit_write(gui._insert_many, (gui._writer_conn, [({"applicant_first_name": "John"}, "life")]),
+                         results.append)
+        gui.submit_write(gui.save_data_to_db, (), results.append)
+        assert gui._pending_writes == 2
+        gui._writeq.put(None)
+        gui._writer.join()
+        gui._writer_conn.close()
+
+        # Nothing runs on the writer thread's behalf until the Tk thread drains the queue
+        assert results == []
+        gui._run_posted_callbacks()
+        assert results[0] == (1, 0, [], None)
+        assert isinstance(results[1], TypeError)
+        assert gui._pending_writes == 0
+        assert gui.get_db_stats() == (1, {"life": 1})
+
+
+def test_failed_batch_keeps_earlier_counts(tmp_path):
+    """A batch that fails to insert stops the save but reports what earlier batches committed."""
+    with make_gui(tmp_path / "aim_partial.db") as gui:
+        records = [({"applicant_first_name": "John"}, "life"), ({"applicant_first_name": "Jane"}, object())]
+
+        saved, duplicates, errors, failure = gui._insert_many(gui._conn, records, batch_size=1)
+
+        assert (saved, duplicates, errors) == (1, 0, [])
+        assert isinstance(failure, sqlite3.Error)
+        assert gui.get_db_stats()[0] == 1
+
+
+def test_close_waits_for_writer_through_the_event_loop(tmp_path):
+    """Closing returns to the main loop while queued writes finish, then quits."""
+    with make_gui(tmp_path / "aim_close.db") as gui:
+        events = []
+        results = []
+
+        class FakeRoot:
+            def after(self, delay, callback, *args):
+                events.append((callback, args))
+
+            def quit(self):
+                events.append(None)
+
+        gui.root = FakeRoot()
+        start_writer(gui)
+        gui.submit_write(gui._insert_many, (gui._writer_conn, [({"applicant_first_name": "John"}, "life")]),
+                         results.append)
+        gui._on_close()
+
+        # Stand in for mainloop: run scheduled callbacks in order until quit
+        while None not in events:
+            if events:
+                callback, args = events.pop(0)
+                callback(*args)
+            else:
+                time.sleep(0.01)
+
+        assert results == [(1, 0, [], None)]
+        assert not gui._writer.is_alive()
+
+
+def test_duplicate_names_are_grouped(tmp_path):
+    """Records sharing an applicant name are reported together, in save order."""
+    with make_gui(tmp_path / "aim_names.db") as gui:
+        gui.save_data_to_db({"applicant_first_name": "John", "applicant_last_name": "Doe", "age": 40}, "life")
+        gui.save_data_to_db({"first_name": " JOHN ", "last_name": "doe"}, "annuity")
+        gui.save_data_to_db({"applicant_first_name": "Jane", "applicant_last_name": "Doe"}, "life")
+        gui.save_data_to_db(["not", "a", "record"], "life")
+
+        duplicates = gui.check_for_duplicate_names()
+
+        assert list(duplicates) == ["john doe"]
+        assert [record['product_type'] for record in duplicates["john doe"]] == ["life", "annuity"]
+        assert duplicates["john doe"][0]['data']['age'] == 40
+
+        # A bulk batch shares one timestamp, so save order falls back to the row id
+        gui.save_many_to_db([({"first_name": "Ann", "last_name": "Lee", "n": n}, "health") for n in range(5)])
+        assert [record['data']['n'] for record in gui.check_for_duplicate_names()["ann lee"]] == [0, 1, 2, 3, 4]
+
+
+def test_jsonl_export_streams_stored_rows(tmp_path):
+    """Each stored record becomes one JSON line with its data embedded as-is."""
+    with make_gui(tmp_path / "aim_export.db") as gui:
+        gui.save_data_to_db({"applicant_first_name": "José", "policy": {"face_amount": 250000}}, "life")
+        gui.save_data_to_db({"applicant_first_name": "Jane"}, "annuity")
+
+        export_path = tmp_path / "export.jsonl"
+        gui.export_jsonl(export_path)
+        with open(export_path, encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f]
+
+        assert lines == [
+            {"product_type": entry['product_type'], "timestamp": entry['timestamp'], "data": entry['data']}
+            for entry in gui.fetch_all_records()
+        ]
+        assert lines[0]["data"]["policy"]["face_amount"] == 250000
+
+        # Legacy NaN rows are re-encoded so every line stays valid JSON
+        gui._conn.execute("INSERT INTO user_data (data_hash, product_type, json_data, timestamp) VALUES (?, ?, ?, ?)",
+                          ("legacy", "life", '{"age": NaN}', "2025-01-01 00:00:00"))
+        gui.export_jsonl(export_path)
+        with open(export_path, "rb") as f:
+            assert {"age": None} in [orjson.loads(line)["data"] for line in f]
+
+
+def test_legacy_hashes_are_migrated(tmp_path):
+    """Rows written with the old salted hash() are rehashed on startup."""
+    db_path = tmp_path / "aim_legacy.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute('''
+        CREATE TABLE user_data (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            data_hash TEXT UNIQUE,
+            product_type TEXT NOT NULL,
+            json_data TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    data = {"applicant_first_name": "John", "applicant_last_name": "Doe"}
+    conn.execute("INSERT INTO user_data (data_hash, product_type, json_data, timestamp) VALUES (?, ?, ?, ?)",
+                 ("-4242", "life", json.dumps(data), "2025-01-01 00:00:00"))
+    # json.dumps wrote NaN for blank Excel cells; such rows must not stop the migration
+    conn.execute("INSERT INTO user_data (data_hash, product_type, json_data, timestamp) VALUES (?, ?, ?, ?)",
+                 ("-4343", "life", json.dumps({**data, "age": float("nan")}), "2025-01-01 00:00:00"))
+    conn.commit()
+    conn.close()
+
+    with make_gui(db_path) as gui:
+        saved, _ = gui.save_data_to_db(data, "life")
+
+        assert not saved
+        assert gui.get_db_stats()[0] == 2
+
+        # The name key is backfilled for rows written before the column existed
+        gui.save_data_to_db({"applicant_first_name": "john", "applicant_last_name": "DOE", "age": 40}, "life")
+        assert len(gui.check_for_duplicate_names()["john doe"]) == 3
+
+
+if __name__ == "__main__":
+    from pathlib import Path
+
+    test_data_hash_is_stable()
+    test_dialog_json_keeps_values_exact()
+    for test in (test_duplicate_rows_are_rejected, test_unencodable_records_are_reported,
+                 test_cached_stats_follow_writes,
+                 test_single_save_records_local_timestamp, test_find_records_searches_in_sql,
+                 test_save_many_batches_and_skips_duplicates, test_writer_thread_runs_queued_saves,
+                 test_failed_batch_keeps_earlier_counts,
+                 test_close_waits_for_writer_through_the_event_loop,
+                 test_duplicate_names_are_grouped, test_jsonl_export_streams_stored_rows,
+                 test_legacy_hashes_are_migrated):
+        with tempfile.TemporaryDirectory() as tmp:
+            test(Path(tmp))
+    print("🏁 Database tests PASSED")
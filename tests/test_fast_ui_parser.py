@@ -0,0 +1,42 @@
+"""
+Tests for FastUIParser flattening of flat and nested FAST UI payloads.
+"""
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from parsers.fast_ui_parser import FastUIParser
+
+
+def test_flat_payload_keeps_lists():
+    """Flat data is parsed field by field and lists stay lists."""
+    parsed = FastUIParser().parse({"First Name": " John ", "riders": ["ADB", "WOP"], "face_amount": "250,000"})
+
+    assert parsed["first_name"] == "John"
+    assert parsed["riders"] == ["ADB", "WOP"]
+    assert parsed["face_amount"] == 250000
+    assert parsed["_parsing_metadata"]["parsed_fields_count"] == 3
+
+
+def test_nested_payload_is_flattened():
+    """Nested sections get prefixed keys and arrays become indexed keys."""
+    parsed = FastUIParser().parse({
+        "applicant": {"first_name": "John", "smoker": "no"},
+        "beneficiary": [{"name": "Jane"}, "Estate"],
+        "state": "TX",
+    })
+
+    assert parsed["applicant_first_name"] == "John"
+    assert parsed["applicant_smoker"] is False
+    assert parsed["beneficiary_1_name"] == "Jane"
+    assert parsed["beneficiary_2"] == "Estate"
+    assert parsed["beneficiary_count"] == 2
+    assert parsed["state"] == "TX"
+
+
+if __name__ == "__main__":
+    test_flat_payload_keeps_lists()
+    test_nested_payload_is_flattened()
+    print("🏁 FAST UI parser tests PASSED")